@@ -1,48 +1,58 @@
 import numpy as np
-import matplotlib.pyplot as plt
 
 # Parameters
 N = 100
 p = 0.6  # Probability of +1
 
+# Random seed for reproducibility (set to None for different runs each time)
+SEED = None
+rng = np.random.default_rng(SEED)
+
 # Generate coin flips: +1 or -1
-flips = np.where(np.random.rand(N) < p, 1, -1)
+flips = np.where(rng.random(N) < p, np.int8(1), np.int8(-1))
 
-# Time average up to step t
-time_avg = np.cumsum(flips) / np.arange(1, N+1)
+# Time average up to step t (running sum divided in place)
+time_avg = np.empty(N)
+np.cumsum(flips, out=time_avg)
+time_avg /= np.arange(1, N+1)
 
 ensemble_avg = 2*p - 1
 
-# Plot everything in one figure
-plt.figure(figsize=(10,6))
-plt.rcParams.update({
-    'font.size': 16,
-    'axes.titlesize': 20,
-    'axes.labelsize': 14,
-    'xtick.labelsize': 12,
-    'ytick.labelsize': 12,
-    'legend.fontsize': 15,
-    'lines.linewidth': 2.5,
-    'grid.linewidth': 1.5,
-    'axes.linewidth': 1.5,
-})
-
-steps = np.arange(1, N+1)
-
-plt.plot(steps, flips, '-', label=f'Coin Flip at Step t')
-plt.plot(steps, time_avg, 'r-', label='Time Average up to t')
-plt.axhline(ensemble_avg, color='g', linestyle='--', label=f'Ensemble Average = {ensemble_avg:.1f}')
-
-plt.xlabel('Step')
-plt.ylabel('Value')
-plt.title('Ergodic Process: Coin Flips')
-plt.legend(loc="upper right", framealpha=1)
-plt.grid(True)
-# plt.show()
-
-# print(f"Final time average after {N} flips: {time_avg[-1]:.3f}")
-# print(f"Ensemble average of one flip: {ensemble_avg:.3f}")
-
-plt.savefig('ergodic.png', dpi=300, bbox_inches='tight', format='png')
-plt.close()
-
+if __name__ == "__main__":
+    import matplotlib.pyplot as plt
+
+    # Plot style, applied once for every figure in this script
+    plt.rcParams.update({
+        'font.size': 16,
+        'axes.titlesize': 20,
+        'axes.labelsize': 14,
+        'xtick.labelsize': 12,
+        'ytick.labelsize': 12,
+        'legend.fontsize': 15,
+        'lines.linewidth': 2.5,
+        'grid.linewidth': 1.5,
+        'axes.linewidth': 1.5,
+    })
+
+    # Plot everything in one figure
+    plt.figure(figsize=(10,6))
+
+    steps = np.arange(1, N+1)
+
+    plt.plot(steps, flips, '-', label=f'Coin Flip at Step t')
+    plt.plot(steps, time_avg, 'r-', label='Time Average up to t')
+    plt.axhline(ensemble_avg, color='g', linestyle='--', label=f'Ensemble Average = {ensemble_avg:.1f}')
+
+    plt.xlabel('Step')
+    plt.ylabel('Value')
+    plt.title('Ergodic Process: Coin Flips')
+    plt.legend(loc="upper right", framealpha=1)
+    plt.grid(True)
+    # plt.show()
+
+    # print(f"Final time average after {N} flips: {time_avg[-1]:.3f}")
+    # print(f"Ensemble average of one flip: {ensemble_avg:.3f}")
+
+    plt.savefig('ergodic.png', dpi=300, bbox_inches='tight', format='png',
+                pil_kwargs={'compress_level': 1})
+    plt.close()
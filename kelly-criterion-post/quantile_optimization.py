@@ -1,5 +1,19 @@
+import multiprocessing as mp
+
 import numpy as np
-import matplotlib.pyplot as plt
+
+# Plot style shared by every figure, applied once when the first one is made
+PLOT_STYLE = {
+    'font.size': 16,
+    'axes.titlesize': 20,
+    'axes.labelsize': 14,
+    'xtick.labelsize': 12,
+    'ytick.labelsize': 12,
+    'legend.fontsize': 15,
+    'lines.linewidth': 2.5,
+    'grid.linewidth': 1.5,
+    'axes.linewidth': 1.5,
+}
 
 ###############################################################################
 #               EXPLICIT SIMULATION PARAMETERS (TWEAK AS NEEDED)              #
@@ -14,6 +28,7 @@ a = 0.85
 b = 0.65
 
 # Number of simulations (Monte Carlo paths) per fraction
+# (set to None to use the exact binomial quantiles instead of simulating)
 T = 2000
 
 # List of number of coin tosses to explore
@@ -42,10 +57,75 @@ def kelly_fraction(p, a, b):
     f_k = (p * a - (1 - p) * b) / (a * b)
     return f_k
 
+
+def quantile_kelly_fraction(n, p, a, b, q):
+    """
+    Compute the fraction f that maximizes the q-th quantile of final wealth
+    after n tosses.
+
+    Final wealth is increasing in the number of wins k ~ Binomial(n, p), so
+    its q-th quantile is the wealth at k_q = binom.ppf(q, n, p). Maximizing
+    k_q * ln(1 + a f) + (n - k_q) * ln(1 - b f) is the Kelly problem with
+    win probability k_q / n:
+
+    f_q = kelly_fraction(k_q / n, a, b), clipped at 0 (no bet).
+    """
+    from scipy.stats import binom
+
+    k_q = binom.ppf(q, n, p)
+    return np.maximum(kelly_fraction(k_q / n, a, b), 0.0)
+
 ###############################################################################
 #                       KELLY SIMULATION (DISTRIBUTION) FUNCTION               #
 ###############################################################################
-def simulate_kelly_distribution(n, p, T, f_values, a=1.0, b=1.0, random_seed=None):
+# Percentiles (in %) averaged in triplets into the 10th, 50th and 90th
+_PERCENTILES = [5, 10, 15, 45, 50, 55, 85, 90, 95]
+
+
+def _percentiles(x, q, func=None):
+    """
+    Percentiles q (in %) of x along its last axis, with the same linear
+    interpolation as np.percentile. Only the order statistics that are needed
+    are selected with np.partition, which is O(T) instead of a full sort.
+
+    If func is given it must be increasing; it is applied (in float64) to the
+    selected order statistics before interpolating, which yields the
+    percentiles of func(x) without evaluating func on all of x.
+
+    Returns an array of shape x.shape[:-1] + (len(q),).
+    """
+    m = x.shape[-1]
+    pos = np.asarray(q, dtype=float) / 100 * (m - 1)
+    lo = np.floor(pos).astype(int)
+    hi = np.minimum(lo + 1, m - 1)
+    part = np.partition(x, np.union1d(lo, hi), axis=-1)
+    x_lo = part[..., lo].astype(np.float64)
+    x_hi = part[..., hi].astype(np.float64)
+    if func is not None:
+        x_lo, x_hi = func(x_lo), func(x_hi)
+    frac = pos - lo
+    return x_lo * (1 - frac) + x_hi * frac
+
+
+def simulate_win_counts(n_list, p, T, rng=None):
+    """
+    Simulate the number of wins of T paths, observed after each number of
+    tosses in n_list (increasing). Longer runs extend the shorter ones, so
+    only the binomial increments between consecutive n are drawn instead of
+    an independent simulation per n.
+
+    Returns an integer array of shape (len(n_list), T).
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+
+    steps = np.diff(n_list, prepend=0)
+    increments = rng.binomial(steps[:, None], p, size=(len(n_list), T))
+    return np.cumsum(increments, axis=0)
+
+
+def simulate_kelly_distribution(n, p, T, f_values, a=1.0, b=1.0, rng=None,
+                                wins=None):
     """
     Simulate a coin-toss betting game for various fractions of wealth.
     Final wealth is multiplied by (1 + a*f) on a win, or (1 - b*f) on a loss.
@@ -64,8 +144,12 @@ def simulate_kelly_distribution(n, p, T, f_values, a=1.0, b=1.0, random_seed=Non
         Win multiplier coefficient.
     b : float
         Loss multiplier coefficient.
-    random_seed : int or None
-        Optional random seed for reproducibility.
+    rng : np.random.Generator or None
+        Random number generator to draw from. A fresh, unseeded generator is
+        used if None.
+    wins : array-like or None
+        Precomputed number of wins of each of the T paths after n tosses
+        (e.g. a row of simulate_win_counts). Drawn from rng if None.
 
     Returns
     -------
@@ -78,36 +162,54 @@ def simulate_kelly_distribution(n, p, T, f_values, a=1.0, b=1.0, random_seed=Non
     p90_wealths : np.ndarray
         90th percentile of final wealth for each fraction f.
     """
-    if random_seed is not None:
-        np.random.seed(random_seed)
-
-    p10_wealths = np.zeros_like(f_values)
-    p50_wealths = np.zeros_like(f_values)
-    p90_wealths = np.zeros_like(f_values)
-
-    for i, f in enumerate(f_values):
-        final_wealth = np.zeros(T)
-
-        for t in range(T):
-            w = 1.0  # start with wealth = 1
-            for _ in range(n):
-                # Coin toss
-                if np.random.rand() < p:
-                    w *= (1 + a * f)  # Win
-                else:
-                    w *= (1 - b * f)  # Lose
-            final_wealth[t] = w
-
-        # Compute the 10th, 50th, and 90th percentiles of final wealth
-        p10_wealths[i] = (np.percentile(final_wealth, 5) +
-                          np.percentile(final_wealth, 10) +
-                          np.percentile(final_wealth, 15)) / 3
-        p50_wealths[i] = (np.percentile(final_wealth, 45) +
-                          np.percentile(final_wealth, 50) +
-                          np.percentile(final_wealth, 55)) / 3
-        p90_wealths[i] = (np.percentile(final_wealth, 85) +
-                          np.percentile(final_wealth, 90) +
-                          np.percentile(final_wealth, 95)) / 3
+    f_values = np.asarray(f_values)
+    if wins is None:
+        if rng is None:
+            rng = np.random.default_rng()
+        wins = rng.binomial(n, p, size=T)
+
+    # Final wealth only depends on the number of wins k ~ Binomial(n, p) in
+    # each path, so draw k directly instead of simulating n tosses. The same
+    # k is shared by every fraction (common random numbers), so all
+    # fractions are evaluated in one pass by broadcasting the log-multipliers
+    # against k (avoids underflow/overflow for large n).
+    # The log-wealth matrix is kept in float32: |log W| <= n * |log(1 - b f)|,
+    # so its relative error is far below plot resolution, whereas the wealth
+    # itself would overflow float32 for large n.
+    k = np.asarray(wins, dtype=np.float32)
+    log_up = np.log1p(a * f_values).astype(np.float32)
+    log_dn = np.log1p(-b * f_values).astype(np.float32)
+    log_wealth = (k[None, :] * log_up[:, None] +
+                  (n - k)[None, :] * log_dn[:, None])  # shape (len(f_values), T)
+
+    # Compute the 10th, 50th, and 90th percentiles of final wealth, each
+    # smoothed as the mean of three neighbouring percentiles. exp is
+    # increasing, so only the selected order statistics are exponentiated.
+    q = _percentiles(log_wealth, _PERCENTILES, func=np.exp)
+    p10_wealths, p50_wealths, p90_wealths = q.reshape(-1, 3, 3).mean(axis=2).T
+
+    return f_values, p10_wealths, p50_wealths, p90_wealths
+
+
+def exact_kelly_distribution(n, p, f_values, a=1.0, b=1.0):
+    """
+    Exact counterpart of simulate_kelly_distribution, without Monte Carlo.
+
+    Final wealth is increasing in the number of wins k ~ Binomial(n, p), so
+    its q-th quantile is the wealth at k_q = binom.ppf(q, n, p). This is the
+    limit T -> infinity of the simulation, at O(1) cost per (n, f, q).
+
+    Parameters and returns are the same as for simulate_kelly_distribution.
+    """
+    from scipy.stats import binom
+
+    f_values = np.asarray(f_values)
+
+    k_q = binom.ppf(np.asarray(_PERCENTILES) / 100, n, p)
+    log_wealth = (k_q[None, :] * np.log1p(a * f_values)[:, None] +
+                  (n - k_q)[None, :] * np.log1p(-b * f_values)[:, None])
+    q = np.exp(log_wealth)  # shape (len(f_values), len(_PERCENTILES))
+    p10_wealths, p50_wealths, p90_wealths = q.reshape(-1, 3, 3).mean(axis=2).T
 
     return f_values, p10_wealths, p50_wealths, p90_wealths
 
@@ -115,11 +217,37 @@ def simulate_kelly_distribution(n, p, T, f_values, a=1.0, b=1.0, random_seed=Non
 ###############################################################################
 #                                 PLOTTING FUNCTION                            #
 ###############################################################################
-def plot_kelly_results(n, f_values, p10, p50, p90, p, a, b):
+# Figure reused for every plot made by this process (created on first use)
+_FIG_AX = None
+
+
+def _shared_axes():
+    """
+    Return the (fig, ax) pair reused across all values of n handled by this
+    process, instead of building and tearing down a Figure per plot.
+
+    matplotlib is only imported here, so importing this module for the
+    simulation functions stays cheap.
+    """
+    global _FIG_AX
+    if _FIG_AX is None:
+        import matplotlib
+        matplotlib.use('Agg')  # figures are only saved to PNG, never shown
+        import matplotlib.pyplot as plt
+
+        plt.rcParams.update(PLOT_STYLE)
+        _FIG_AX = plt.subplots(figsize=(10, 6))
+    return _FIG_AX
+
+
+def plot_kelly_results(n, f_values, p10, p50, p90, p, a, b, ax=None):
     """
     Plot the 10th, 50th, and 90th percentile final wealth vs fraction f,
     along with the analytical Kelly fraction and the f-values that maximize
     each percentile.
+
+    The plot is drawn on ax (cleared first), or on the process-wide shared
+    axes if ax is None, and saved to kelly_sim_{n}.png.
     """
     # Discrete maxima
     idx_max_p10 = np.argmax(p10)
@@ -130,59 +258,73 @@ def plot_kelly_results(n, f_values, p10, p50, p90, p, a, b):
     f_opt_p50 = f_values[idx_max_p50]
     f_opt_p90 = f_values[idx_max_p90]
 
+    # Exact fractions maximizing each quantile (no grid)
+    f_exact_p10, f_exact_p50, f_exact_p90 = quantile_kelly_fraction(
+        n, p, a, b, [0.1, 0.5, 0.9])
+
     # Analytical Kelly fraction
     f_kelly = kelly_fraction(p, a, b)
 
-    # Create a new figure for this value of n
-    plt.figure(figsize=(10, 6))
-    plt.rcParams.update({
-    'font.size': 16,
-    'axes.titlesize': 20,
-    'axes.labelsize': 14,
-    'xtick.labelsize': 12,
-    'ytick.labelsize': 12,
-    'legend.fontsize': 15,
-    'lines.linewidth': 2.5,
-    'grid.linewidth': 1.5,
-    'axes.linewidth': 1.5,
-    })
+    # Reuse the figure from the previous value of n
+    if ax is None:
+        _, ax = _shared_axes()
+    ax.clear()
+    fig = ax.figure
 
     # Plot the percentiles
-    plt.plot(f_values, p10, label='10th Percentile', color='blue', marker='o')
-    plt.plot(f_values, p50, label='50th Percentile (Median)', color='green', marker='o')
-    plt.plot(f_values, p90, label='90th Percentile', color='orange', marker='o')
+    ax.plot(f_values, p10, label='10th Percentile', color='blue', marker='o')
+    ax.plot(f_values, p50, label='50th Percentile (Median)', color='green', marker='o')
+    ax.plot(f_values, p90, label='90th Percentile', color='orange', marker='o')
 
     # Plot vertical lines for the discrete fractions that maximize each percentile
-    plt.axvline(f_opt_p10, color='blue', linestyle='--',
-                label=f'Max 10% @ f={f_opt_p10:.3f}')
-    plt.axvline(f_opt_p50, color='green', linestyle='--',
-                label=f'Max 50% @ f={f_opt_p50:.3f}')
-    plt.axvline(f_opt_p90, color='orange', linestyle='--',
-                label=f'Max 90% @ f={f_opt_p90:.3f}')
+    # (the exact optimum is reported alongside the grid-based one)
+    ax.axvline(f_opt_p10, color='blue', linestyle='--',
+               label=f'Max 10% @ f={f_opt_p10:.3f} (exact {f_exact_p10:.3f})')
+    ax.axvline(f_opt_p50, color='green', linestyle='--',
+               label=f'Max 50% @ f={f_opt_p50:.3f} (exact {f_exact_p50:.3f})')
+    ax.axvline(f_opt_p90, color='orange', linestyle='--',
+               label=f'Max 90% @ f={f_opt_p90:.3f} (exact {f_exact_p90:.3f})')
 
     # Plot the analytical Kelly fraction as a red dashed line (if it lies in [0,1], we still show it even if outside)
-    plt.axvline(f_kelly, color='red', linestyle='--', label=f'Kelly @ f={f_kelly:.3f}')
+    ax.axvline(f_kelly, color='red', linestyle='--', label=f'Kelly @ f={f_kelly:.3f}')
 
     # Thicker horizontal line at y = 0 in linear scale
-    plt.axhline(1, color='black', linewidth=2)
+    ax.axhline(1, color='black', linewidth=2)
 
-    plt.title(f'Kelly Simulation (t={n}, p={p:.2f}, a={a}, b={b})')
-    plt.xlabel('Fraction of Wealth Bet (f)')
-    plt.ylabel('Final Wealth (log scale)')
-    plt.yscale('log')
-    plt.grid(True, which='both', linestyle='--', linewidth=0.5)
-    plt.legend(loc='best', framealpha=1)
-    plt.tight_layout()
+    ax.set_title(f'Kelly Simulation (t={n}, p={p:.2f}, a={a}, b={b})')
+    ax.set_xlabel('Fraction of Wealth Bet (f)')
+    ax.set_ylabel('Final Wealth (log scale)')
+    ax.set_yscale('log')
+    ax.grid(True, which='both', linestyle='--', linewidth=0.5)
+    ax.legend(loc='best', framealpha=1)
+    fig.tight_layout()
 
     # plt.show()
-    plt.savefig(f'kelly_sim_{n}.png', dpi=300, bbox_inches='tight', format='png')
+    fig.savefig(f'kelly_sim_{n}.png', dpi=300, bbox_inches='tight', format='png',
+                pil_kwargs={'compress_level': 1})
 
 
 ###############################################################################
-#                                MAIN SCRIPT                                  #
+#                               SINGLE-n RUN                                  #
 ###############################################################################
-if __name__ == "__main__":
-    for n in N_LIST:
+def run_one_n(n, wins):
+    """
+    Compute the percentiles from the simulated win counts (or, if T is None,
+    exactly) and plot the results for a single number of coin tosses n.
+    This is the unit of work for the process pool.
+
+    wins holds the number of wins of each simulated path after n tosses
+    (None if T is None).
+    """
+    if T is None:
+        f_vals, p10_vals, p50_vals, p90_vals = exact_kelly_distribution(
+            n=n,
+            p=P,
+            f_values=F_VALUES,
+            a=a,
+            b=b
+        )
+    else:
         f_vals, p10_vals, p50_vals, p90_vals = simulate_kelly_distribution(
             n=n,
             p=P,
@@ -190,6 +332,22 @@ if __name__ == "__main__":
             f_values=F_VALUES,
             a=a,
             b=b,
-            random_seed=SEED
+            wins=wins
         )
-        plot_kelly_results(n, f_vals, p10_vals, p50_vals, p90_vals, P, a, b)
+    plot_kelly_results(n, f_vals, p10_vals, p50_vals, p90_vals, P, a, b)
+
+
+###############################################################################
+#                                MAIN SCRIPT                                  #
+###############################################################################
+if __name__ == "__main__":
+    # Simulate the paths once up to max(N_LIST) and observe them at every n,
+    # so the random draws are done in the main process and stay reproducible
+    if T is None:
+        wins_per_n = [None] * len(N_LIST)
+    else:
+        rng = np.random.default_rng(SEED)
+        wins_per_n = simulate_win_counts(N_LIST, P, T, rng)
+
+    with mp.Pool() as pool:
+        pool.starmap(run_one_n, zip(N_LIST, wins_per_n))
@@ -1,5 +1,4 @@
 import numpy as np
-import matplotlib.pyplot as plt
 
 # Define the x-axis values (log10(E/eV)) spanning from -2 to 7.
 # These are the lower edges of each decade point.
@@ -22,7 +21,6 @@ x = np.array([-2, -1, 0, 1, 2, 3, 4, 5, 6, 7])
 #   x=6  (1 MeV):     log10(σ) ≈ -23.82   => ~1.5e-24 cm²
 #   x=7  (10 MeV):    log10(σ) ≈ -23.89   => ~1.3e-24 cm²
 log_sigma_u235 = np.array([-21.10, -21.30, -21.70, -22.22, -22.70, -23.30, -23.70, -24.00, -23.82, -23.89])
-sigma_u235 = 10 ** log_sigma_u235
 
 # For Pu-239 fission, thermal values are higher (~750 barns, ~7.5e-22 cm²),
 # and in the fast region it settles near ~3e-24 cm².
@@ -38,7 +36,9 @@ sigma_u235 = 10 ** log_sigma_u235
 #   x=6:  ≈ -23.52   => ~3e-24 cm²
 #   x=7:  ≈ -23.55
 log_sigma_pu239 = np.array([-21.05, -21.16, -21.52, -22.00, -22.40, -23.00, -23.40, -23.70, -23.52, -23.55])
-sigma_pu239 = 10 ** log_sigma_pu239
+
+# Convert both log10(σ) tables to σ in a single vectorized pass.
+sigma_u235, sigma_pu239 = np.power(10.0, np.stack([log_sigma_u235, log_sigma_pu239]))
 
 # For U-238 fission, the cross section is negligible (set to a nominal value ~10^-30)
 # in the thermal region (x <= 3), then starts rising in the fast region:
@@ -50,31 +50,34 @@ sigma_pu239 = 10 ** log_sigma_pu239
 sigma_u238 = np.array([1e-30, 1e-30, 1e-30, 1e-30, 1e-29, 1e-27, 10**(-26.16), 10**(-25.10), 10**(-24.16), 10**(-24.10)])
 # (For x=6 and 7 we repeat the fast-region values.)
 
-# Create the plot
-fig, ax = plt.subplots(figsize=(8, 6))
+if __name__ == "__main__":
+    import matplotlib.pyplot as plt
 
-# Plot the curves for each isotope; note that the curves are only defined up to x = 7,
-# but we set the x-axis limit to 8 for styling.
-ax.plot(x, sigma_u238, marker='^', color="green", linestyle='-', label='U-238')
-ax.plot(x, sigma_u235, marker='o', color="blue", linestyle='-', label='U-235')
-ax.plot(x, sigma_pu239, marker='s', color="orange", linestyle='-', label='Pu-239')
+    # Create the plot
+    fig, ax = plt.subplots(figsize=(8, 6))
 
-# Set x-axis and y-axis limits.
-ax.set_xlim([-2, 8])
-ax.set_ylim([1e-25, 2e-21])
+    # Plot the curves for each isotope; note that the curves are only defined up to x = 7,
+    # but we set the x-axis limit to 8 for styling.
+    ax.plot(x, sigma_u238, marker='^', color="green", linestyle='-', label='U-238')
+    ax.plot(x, sigma_u235, marker='o', color="blue", linestyle='-', label='U-235')
+    ax.plot(x, sigma_pu239, marker='s', color="orange", linestyle='-', label='Pu-239')
 
-# Set labels and title.
-ax.set_xlabel(r'Energy in $\log_{10}$(eV)')
-ax.set_ylabel(r'Fission cross section, $\sigma_f$ [cm$^2$]')
-ax.set_title('Fission Cross Sections for U-235, Pu-239, and U-238')
+    # Set x-axis and y-axis limits.
+    ax.set_xlim([-2, 8])
+    ax.set_ylim([1e-25, 2e-21])
 
-# Use a logarithmic scale for the y-axis.
-ax.set_yscale('log')
+    # Set labels and title.
+    ax.set_xlabel(r'Energy in $\log_{10}$(eV)')
+    ax.set_ylabel(r'Fission cross section, $\sigma_f$ [cm$^2$]')
+    ax.set_title('Fission Cross Sections for U-235, Pu-239, and U-238')
 
-# Add gridlines and legend.
-ax.grid(True, which='both', linestyle='--', linewidth=0.5)
-ax.legend()
+    # Use a logarithmic scale for the y-axis.
+    ax.set_yscale('log')
 
-plt.savefig('cross-sections.png', dpi=300, bbox_inches='tight', format='png')
-plt.close()
+    # Add gridlines and legend.
+    ax.grid(True, which='both', linestyle='--', linewidth=0.5)
+    ax.legend()
 
+    plt.savefig('cross-sections.png', dpi=300, bbox_inches='tight', format='png',
+                pil_kwargs={'compress_level': 1})
+    plt.close()
@@ -1,11 +1,18 @@
 import numpy as np
-import matplotlib.pyplot as plt
+
+# Normalization constant of the Maxwellian, computed once
+TWO_OVER_SQRT_PI = 2 / np.sqrt(np.pi)
 
 # Define a Maxwellian function (normalized to unity)
 def maxwellian(E, T):
     # E in MeV, T in MeV.
     # f(E) = (2/sqrt(pi)) * (sqrt(E)/T^(3/2)) * exp(-E/T)
-    return (2/np.sqrt(np.pi)) * (E**0.5 / T**1.5) * np.exp(-E/T)
+    # The T-dependent prefactor is a scalar, and the products are done in
+    # place so only one array is allocated besides sqrt(E).
+    f = np.exp(E * (-1.0 / T))
+    f *= np.sqrt(E)
+    f *= TWO_OVER_SQRT_PI / (T * np.sqrt(T))
+    return f
 
 # Temperature parameters chosen so that the mean energy (1.5*T) agrees with Los Alamos Primer estimates
 T_u235 = 1.33  # gives mean ~2.0 MeV
@@ -25,34 +32,38 @@ f_u235 = maxwellian(E, T_u235)
 f_pu239 = maxwellian(E, T_pu239)
 f_u238 = maxwellian(E, T_u238)
 
-# Create the plot with the same color ordering as the cross section plot:
-# U-235: blue, U-238: orange, Pu-239: green.
-fig, ax = plt.subplots(figsize=(8, 6))
-
-ax.plot(E, f_u238, label='U-238', lw=2, color='green')
-ax.plot(E, f_u235, label='U-235', lw=2, color='blue')
-ax.plot(E, f_pu239, label='Pu-239', lw=2, color='orange')
-
-# Plot vertical lines for the means
-ax.axvline(mean_u238, color='green', linestyle='--', lw=1.5,
-           label=r'U-238 mean = {:.1f} MeV'.format(mean_u238))
-ax.axvline(mean_u235, color='blue', linestyle='--', lw=1.5,
-           label=r'U-235 mean = {:.1f} MeV'.format(mean_u235))
-ax.axvline(mean_pu239, color='orange', linestyle='--', lw=1.5,
-           label=r'Pu-239 mean = {:.1f} MeV'.format(mean_pu239))
-
-# Set axis limits
-ax.set_xlim([0, 8.0])  # Extend x-axis to 4.5 MeV for style
-ax.set_ylim([0, 0.5])  # Adjust y-axis for clarity
-
-# Set labels and title
-ax.set_xlabel('Neutron energy (MeV)', fontsize=12)
-ax.set_ylabel('Normalized Probability Density', fontsize=12)
-ax.set_title('Fission Neutron Spectra', fontsize=14)
-
-# Add gridlines and legend
-ax.grid(True, linestyle='--', linewidth=0.5)
-ax.legend(fontsize=10)
-
-plt.savefig('energy-distribution-emitted-neutrons.png', dpi=300, bbox_inches='tight', format='png')
-plt.close()
+if __name__ == "__main__":
+    import matplotlib.pyplot as plt
+
+    # Create the plot with the same color ordering as the cross section plot:
+    # U-235: blue, U-238: orange, Pu-239: green.
+    fig, ax = plt.subplots(figsize=(8, 6))
+
+    ax.plot(E, f_u238, label='U-238', lw=2, color='green')
+    ax.plot(E, f_u235, label='U-235', lw=2, color='blue')
+    ax.plot(E, f_pu239, label='Pu-239', lw=2, color='orange')
+
+    # Plot vertical lines for the means
+    ax.axvline(mean_u238, color='green', linestyle='--', lw=1.5,
+               label=r'U-238 mean = {:.1f} MeV'.format(mean_u238))
+    ax.axvline(mean_u235, color='blue', linestyle='--', lw=1.5,
+               label=r'U-235 mean = {:.1f} MeV'.format(mean_u235))
+    ax.axvline(mean_pu239, color='orange', linestyle='--', lw=1.5,
+               label=r'Pu-239 mean = {:.1f} MeV'.format(mean_pu239))
+
+    # Set axis limits
+    ax.set_xlim([0, 8.0])  # Extend x-axis to 4.5 MeV for style
+    ax.set_ylim([0, 0.5])  # Adjust y-axis for clarity
+
+    # Set labels and title
+    ax.set_xlabel('Neutron energy (MeV)', fontsize=12)
+    ax.set_ylabel('Normalized Probability Density', fontsize=12)
+    ax.set_title('Fission Neutron Spectra', fontsize=14)
+
+    # Add gridlines and legend
+    ax.grid(True, linestyle='--', linewidth=0.5)
+    ax.legend(fontsize=10)
+
+    plt.savefig('energy-distribution-emitted-neutrons.png', dpi=300, bbox_inches='tight', format='png',
+                pil_kwargs={'compress_level': 1})
+    plt.close()